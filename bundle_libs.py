@@ -15,8 +15,10 @@ import struct
 import subprocess
 import sys
 import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 
 def get_platform_tag():
@@ -108,22 +110,6 @@ def get_turbojpeg_lib_path():
     return None, None
 
 
-def find_library(lib_name: str, search_paths: list) -> Path | None:
-    """Find a library file in the search paths."""
-    for search_path in search_paths:
-        path = Path(search_path)
-        if not path.exists():
-            continue
-        # Look for the library (handle symlinks)
-        for lib_file in path.glob(f"{lib_name}*"):
-            if lib_file.is_file():
-                # Follow symlink to get the real file
-                real_path = lib_file.resolve()
-                if real_path.exists():
-                    return real_path
-    return None
-
-
 def patch_rpath(lib_path: Path, new_rpath: str):
     """Patch the RPATH of a library using patchelf (Linux only)."""
     if platform.system() != "Linux":
@@ -140,6 +126,38 @@ def patch_rpath(lib_path: Path, new_rpath: str):
         print("Warning: patchelf not found. RPATH not patched.")
 
 
+def deflate_file(file_path: Path, arcname: str):
+    """Read and raw-deflate a file ahead of writing it into a wheel."""
+    zinfo = ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = ZIP_DEFLATED
+    data = file_path.read_bytes()
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+    )
+    compressed = compressor.compress(data) + compressor.flush()
+    zinfo.CRC = zlib.crc32(data)
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(compressed)
+    return zinfo, compressed
+
+
+def write_deflated(zf: ZipFile, zinfo: ZipInfo, compressed: bytes):
+    """
+    Write an already-deflated member into a ZipFile.
+
+    ZipFile has no public API for raw members, so this mirrors what
+    ZipFile.open(..., "w") does when the member is closed.
+    """
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader())
+    zf.fp.write(compressed)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+
 def bundle_wheel(wheel_path: str, output_dir: str = None) -> str:
     """
     Bundle libjpeg-turbo libraries into a wheel.
@@ -169,17 +187,11 @@ def bundle_wheel(wheel_path: str, output_dir: str = None) -> str:
     print(f"Using libjpeg-turbo from: {lib_dir}")
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        extract_dir = tmpdir / "wheel"
-
-        # Extract wheel
-        print(f"Extracting wheel: {wheel_path}")
-        with ZipFile(wheel_path, "r") as zf:
-            zf.extractall(extract_dir)
-
-        # Create libs directory
-        libs_dir = extract_dir / "turbojpeg_libs"
-        libs_dir.mkdir(exist_ok=True)
+        # Only the bundled libraries are staged on disk (patchelf needs real
+        # files); the original wheel members are recompressed straight from
+        # the input wheel into the output without an intermediate tree.
+        libs_dir = Path(tmpdir) / "turbojpeg_libs"
+        libs_dir.mkdir()
 
         # Copy the main library
         system = platform.system()
@@ -204,13 +216,16 @@ def bundle_wheel(wheel_path: str, output_dir: str = None) -> str:
 
         # On Linux, also copy any versioned symlinks
         if system == "Linux":
-            for lib_file in Path(lib_dir).glob("libturbojpeg.so*"):
-                if lib_file.is_symlink():
-                    continue
-                dest = libs_dir / lib_file.name
-                if not dest.exists():
-                    print(f"Bundling: {lib_file} -> {dest.name}")
-                    shutil.copy2(lib_file, dest)
+            with os.scandir(lib_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("libturbojpeg.so"):
+                        continue
+                    if entry.is_symlink():
+                        continue
+                    dest = libs_dir / entry.name
+                    if not dest.exists():
+                        print(f"Bundling: {entry.path} -> {dest.name}")
+                        shutil.copy2(entry.path, dest)
 
         # Patch RPATH for bundled libraries on Linux
         if system == "Linux":
@@ -222,45 +237,72 @@ def bundle_wheel(wheel_path: str, output_dir: str = None) -> str:
         platform_tag = get_platform_tag()
         print(f"Platform tag: {platform_tag}")
 
-        # Update WHEEL metadata file with correct platform tag
-        wheel_files = list(extract_dir.glob("*.dist-info/WHEEL"))
-        if wheel_files:
-            wheel_file = wheel_files[0]
-            with open(wheel_file, "r") as f:
-                wheel_content = f.read()
-            
-            # Replace the Tag line(s) with the correct platform
-            # Original: Tag: py3-none-any
-            # New: Tag: py3-none-{platform_tag}
-            wheel_content = re.sub(
-                r"Tag: (py\d+|cp\d+)-(\w+)-\w+",
-                rf"Tag: \1-\2-{platform_tag}",
-                wheel_content
-            )
-            
-            with open(wheel_file, "w") as f:
-                f.write(wheel_content)
-            print(f"Updated WHEEL metadata with platform tag")
-
-        # Update RECORD file
-        record_files = list(extract_dir.glob("*.dist-info/RECORD"))
-        if record_files:
-            record_file = record_files[0]
-            with open(record_file, "a") as f:
-                for lib_file in libs_dir.iterdir():
-                    rel_path = lib_file.relative_to(extract_dir)
-                    f.write(f"{rel_path},,\n")
-
         # Determine output wheel name with correct platform tag
         output_wheel = rename_wheel_with_platform(wheel_path, platform_tag)
         output_wheel = output_dir / output_wheel.name
 
+        lib_files = sorted(libs_dir.iterdir())
+        lib_arcnames = [f"{libs_dir.name}/{lib_file.name}" for lib_file in lib_files]
+
+        # Write next to the destination and swap in afterwards, since the
+        # input wheel may already carry the platform tag (same path)
+        partial_wheel = output_wheel.with_name(output_wheel.name + ".part")
+
         print(f"Creating bundled wheel: {output_wheel}")
-        with ZipFile(output_wheel, "w") as zf:
-            for file_path in extract_dir.rglob("*"):
-                if file_path.is_file() or file_path.is_symlink():
-                    arcname = file_path.relative_to(extract_dir)
-                    zf.write(file_path, arcname)
+        try:
+            with ThreadPoolExecutor() as pool, \
+                    ZipFile(wheel_path, "r") as zin, \
+                    ZipFile(partial_wheel, "w", ZIP_DEFLATED) as zout:
+                # Compress the bundled libraries in the background (zlib releases
+                # the GIL) while the original members are copied across
+                deflated_libs = [
+                    pool.submit(deflate_file, lib_file, arcname)
+                    for lib_file, arcname in zip(lib_files, lib_arcnames)
+                ]
+
+                record_info = None
+                for zinfo in zin.infolist():
+                    name = zinfo.filename
+                    if name.startswith(f"{libs_dir.name}/"):
+                        continue
+                    if name.endswith(".dist-info/RECORD"):
+                        # Written last, once the bundled libraries are known
+                        record_info = zinfo
+                        continue
+                    if name.endswith(".dist-info/WHEEL"):
+                        # Replace the Tag line(s) with the correct platform
+                        # Original: Tag: py3-none-any
+                        # New: Tag: py3-none-{platform_tag}
+                        wheel_content = zin.read(zinfo).decode("utf-8")
+                        wheel_content = re.sub(
+                            r"Tag: (py\d+|cp\d+)-(\w+)-\w+",
+                            rf"Tag: \1-\2-{platform_tag}",
+                            wheel_content
+                        )
+                        zout.writestr(zinfo, wheel_content)
+                        print(f"Updated WHEEL metadata with platform tag")
+                        continue
+                    with zin.open(zinfo) as src, zout.open(zinfo, "w") as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+
+                for future in deflated_libs:
+                    write_deflated(zout, *future.result())
+
+                # Update RECORD file
+                if record_info is not None:
+                    record_lines = [
+                        line
+                        for line in zin.read(record_info).decode("utf-8").splitlines()
+                        if line and not line.startswith(f"{libs_dir.name}/")
+                    ]
+                    record_lines += [f"{arcname},," for arcname in lib_arcnames]
+                    record = "\n".join(record_lines) + "\n"
+                    zout.writestr(record_info, record)
+
+            os.replace(partial_wheel, output_wheel)
+        except BaseException:
+            partial_wheel.unlink(missing_ok=True)
+            raise
 
         # Remove the original any-platform wheel if it exists and is different
         original_any_wheel = output_dir / wheel_path.name
@@ -6,7 +6,10 @@ This module provides fast JPEG encoding/decoding using libjpeg-turbo,
 with native support for PyTorch tensors.
 """
 
+import functools
+import platform
 import re
+import shutil
 import subprocess
 
 from setuptools import setup
@@ -14,75 +17,76 @@ from setuptools import setup
 BASE_VERSION = "2.0.0"
 
 
-def get_turbojpeg_version():
-    """Detect libjpeg-turbo version and return a version suffix like 'tj212'."""
-    # Try pkg-config first
+def _parse_version(output, find=re.match):
+    """Parse a version like '2.1.2' from tool output into a suffix like 'tj212'."""
+    match = find(r"(\d+)\.(\d+)\.(\d+)", output)
+    if match:
+        major, minor, patch = match.groups()
+        return f"tj{major}{minor}{patch}"
+    return None
+
+
+def _run(args, timeout=5):
+    """Run a version probe, returning its stdout or None if unavailable or failed."""
+    if shutil.which(args[0]) is None:
+        return None
     try:
         result = subprocess.run(
-            ["pkg-config", "--modversion", "libturbojpeg"],
+            args,
             capture_output=True,
             text=True,
+            timeout=timeout,
         )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            # Parse version like "2.1.2" -> "tj212"
-            match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
-            if match:
-                major, minor, patch = match.groups()
-                return f"tj{major}{minor}{patch}"
-    except FileNotFoundError:
-        pass
-
-    # Try dpkg on Debian/Ubuntu
+    except subprocess.TimeoutExpired:
+        print(f"Warning: {' '.join(args)} timed out after {timeout}s; "
+              "libjpeg-turbo version suffix may be missing.")
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _try_pkgconfig():
+    output = _run(["pkg-config", "--modversion", "libturbojpeg"])
+    return _parse_version(output) if output else None
+
+
+def _try_dpkg():
+    # Debian/Ubuntu, version like "2.1.2-0ubuntu1"
     for pkg_name in ["libturbojpeg", "libturbojpeg0", "libjpeg-turbo8"]:
-        try:
-            result = subprocess.run(
-                ["dpkg-query", "-W", "-f=${Version}", pkg_name],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                # Parse version like "2.1.2-0ubuntu1" -> "tj212"
-                match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
-                if match:
-                    major, minor, patch = match.groups()
-                    return f"tj{major}{minor}{patch}"
-        except FileNotFoundError:
-            pass
-
-    # Try rpm on RHEL/Fedora
-    try:
-        result = subprocess.run(
-            ["rpm", "-q", "--queryformat", "%{VERSION}", "libjpeg-turbo-devel"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
-            if match:
-                major, minor, patch = match.groups()
-                return f"tj{major}{minor}{patch}"
-    except FileNotFoundError:
-        pass
-
-    # Try brew on macOS
-    try:
-        result = subprocess.run(
-            ["brew", "list", "--versions", "jpeg-turbo"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            # Output like "jpeg-turbo 2.1.2"
-            version = result.stdout.strip()
-            match = re.search(r"(\d+)\.(\d+)\.(\d+)", version)
-            if match:
-                major, minor, patch = match.groups()
-                return f"tj{major}{minor}{patch}"
-    except FileNotFoundError:
-        pass
+        output = _run(["dpkg-query", "-W", "-f=${Version}", pkg_name])
+        suffix = _parse_version(output) if output else None
+        if suffix:
+            return suffix
+    return None
+
+
+def _try_rpm():
+    # RHEL/Fedora
+    output = _run(["rpm", "-q", "--queryformat", "%{VERSION}", "libjpeg-turbo-devel"])
+    return _parse_version(output) if output else None
+
+
+def _try_brew():
+    # macOS, output like "jpeg-turbo 2.1.2"
+    # brew's Ruby startup can take several seconds on a cold machine
+    output = _run(["brew", "list", "--versions", "jpeg-turbo"], timeout=60)
+    return _parse_version(output, find=re.search) if output else None
+
+
+@functools.lru_cache(maxsize=1)
+def get_turbojpeg_version():
+    """Detect libjpeg-turbo version and return a version suffix like 'tj212'."""
+    probes = {
+        "Linux": [_try_pkgconfig, _try_dpkg, _try_rpm],
+        "Darwin": [_try_pkgconfig, _try_brew],
+        "Windows": [],
+    }.get(platform.system(), [_try_pkgconfig])
+
+    for probe in probes:
+        suffix = probe()
+        if suffix:
+            return suffix
 
     # Fallback - no version suffix
     return None